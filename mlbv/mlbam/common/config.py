@@ -26,6 +26,9 @@ BANDWIDTH_CHOICES = (
 
 CONFIG = None  # holds a Config instance
 
+# the script name minus any extension, used for the config and temp directory names
+SCRIPT_NAME = os.path.splitext(os.path.basename(sys.argv[0]))[0]
+
 # These are initialized/updated via the Config class
 DEBUG = False
 VERBOSE = False
@@ -52,7 +55,7 @@ class Config:
     )
 
     def __init__(self, defaults, args):
-        script_name = os.path.splitext(os.path.basename(sys.argv[0]))[0]
+        script_name = SCRIPT_NAME
         self.defaults = defaults
         self.dir = self.__find_config_dir(script_name)
         self.parser = self.__init_configparser(script_name)
@@ -78,11 +81,8 @@ class Config:
             for config_dir_name in (script_name, "." + script_name):
                 test_dir = os.path.join(config_dir_base, config_dir_name)
                 searched_paths.append(test_dir)
-                if (
-                    os.path.exists(test_dir)
-                    and os.path.isdir(test_dir)
-                    and os.path.exists(os.path.join(test_dir, "config"))
-                ):
+                # (isfile implies the directory exists)
+                if os.path.isfile(os.path.join(test_dir, "config")):
                     config_dir = test_dir
                     break
             if config_dir is not None:
@@ -111,7 +111,7 @@ class Config:
     @staticmethod
     def generate_config(username=None, password=None, servicename="MLB.tv"):
         """Creates config file from template + user prompts."""
-        script_name = os.path.splitext(os.path.basename(sys.argv[0]))[0]
+        script_name = SCRIPT_NAME
         # use the script name minus any extension for the config directory
         config_dir = None
         config_dir = os.path.join(Config.config_dir_roots[1], script_name)
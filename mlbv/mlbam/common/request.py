@@ -4,6 +4,7 @@ Handle HTTP requests
 This is a small wrapper around requests/json, with support for some very rudimentary caching.
 """
 
+import atexit
 import json
 import logging
 import os
@@ -12,13 +13,22 @@ import time
 
 import requests
 
+from requests.adapters import HTTPAdapter
+
 import mlbv.mlbam.common.config as config
 import mlbv.mlbam.common.util as util
 
 
 LOG = logging.getLogger(__name__)
 
-CACHE = dict()
+# A shared session, so that connections are kept alive across requests (e.g. for the
+# data refresh after --wait). The pool size allows for concurrent game day requests.
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+HTTP_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+atexit.register(HTTP_SESSION.close)
+
+CACHE = dict()  # in-memory cache, maps output_filename -> (timestamp, json_data)
 MAX_CACHE_FILENAME_LEN = 250
 
 # These values are used to control the stale times on cached data.
@@ -46,8 +56,8 @@ def _get_cachedir():
     cachedir = os.path.join(util.get_tempdir(), "cache")
     if not os.path.exists(cachedir):
         LOG.debug("Creating cache directory: " + cachedir)
-    if not os.path.exists(cachedir):
-        os.makedirs(cachedir)
+        # exist_ok: requests may be made concurrently
+        os.makedirs(cachedir, exist_ok=True)
     return cachedir
 
 
@@ -62,22 +72,25 @@ def request_json(url, output_filename=None, cache_stale=None):
     if output_filename and len(output_filename) >= MAX_CACHE_FILENAME_LEN:
         output_filename = output_filename[0 : MAX_CACHE_FILENAME_LEN - 1]
     if output_filename and cache_stale:
+        # the in-memory cache is also subject to cache_stale, e.g. for the refresh after --wait
         if output_filename in CACHE:
-            return CACHE[output_filename]
+            cached_time, cached_json = CACHE[output_filename]
+            if time.time() - cached_time < cache_stale:
+                return cached_json
         json_file = os.path.join(_get_cachedir(), "{}.json".format(output_filename))
-        if os.path.exists(json_file) and (
-            int(time.time()) - os.path.getmtime(json_file) < cache_stale
-        ):
-            with open(json_file) as jfh:
-                CACHE[output_filename] = json.load(jfh)
-            if config.DEBUG:
-                LOG.info("Loaded from cache: %s", output_filename)
-            return CACHE[output_filename]
+        if os.path.exists(json_file):
+            cached_time = os.path.getmtime(json_file)
+            if time.time() - cached_time < cache_stale:
+                with open(json_file) as jfh:
+                    CACHE[output_filename] = (cached_time, json.load(jfh))
+                if config.DEBUG:
+                    LOG.info("Loaded from cache: %s", output_filename)
+                return CACHE[output_filename][1]
 
     LOG.debug("Getting url=%s ...", url)
-    headers = {"User-Agent": config.CONFIG.ua_iphone, "Connection": "close"}
+    headers = {"User-Agent": config.CONFIG.ua_iphone}
     util.log_http(url, "get", headers, sys._getframe().f_code.co_name)
-    response = requests.get(url, headers=headers, verify=config.VERIFY_SSL)
+    response = HTTP_SESSION.get(url, headers=headers, verify=config.VERIFY_SSL)
     response.raise_for_status()
 
     # Note: this fails on windows in some cases https://github.com/kennethreitz/requests-html/issues/171
@@ -87,6 +100,6 @@ def request_json(url, output_filename=None, cache_stale=None):
             out.write(response.text)
     if cache_stale:
         LOG.debug("Caching url=%s, filename=%s", url, output_filename)
-        CACHE[output_filename] = response.json()
-        return CACHE[output_filename]
+        CACHE[output_filename] = (time.time(), response.json())
+        return CACHE[output_filename][1]
     return response.json()
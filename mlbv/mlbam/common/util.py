@@ -32,7 +32,7 @@ class Usage(Exception):
 
 
 def init_logging(log_file=None, append=False, console_loglevel=logging.INFO):
-    """Set up logging to file and console."""
+    """Set up logging to console, and to file if log_file is given."""
     if log_file is not None:
         if append:
             filemode_val = "a"
@@ -45,6 +45,8 @@ def init_logging(log_file=None, append=False, console_loglevel=logging.INFO):
             filename=log_file,
             filemode=filemode_val,
         )
+    else:
+        logging.getLogger("").setLevel(console_loglevel)
     # define a Handler which writes INFO messages or higher to the sys.stderr
     console = logging.StreamHandler()
     console.setLevel(console_loglevel)
@@ -73,10 +75,9 @@ def get_tempdir():
         if "<timestamp>" in tempdir:
             tempdir = tempdir.replace("<timestamp>", time.strftime("%Y-%m-%d-%H%M"))
     else:
-        script_name = os.path.splitext(os.path.basename(sys.argv[0]))[0]
-        tempdir = os.path.join(tempfile.gettempdir(), script_name)
+        tempdir = os.path.join(tempfile.gettempdir(), config.SCRIPT_NAME)
     if not os.path.exists(tempdir):
-        os.makedirs(tempdir)
+        os.makedirs(tempdir, exist_ok=True)
     return tempdir
 
 
@@ -99,6 +100,11 @@ def has_reached_time(datetime_val_utc):
     return datetime_val_utc < datetime.now(timezone.utc)
 
 
+def get_secs_until_time(datetime_val_utc):
+    """Returns the number of seconds until the given time (negative if the time has passed)."""
+    return (datetime_val_utc - datetime.now(timezone.utc)).total_seconds()
+
+
 def get_csv_list(csv_string):
     """Returns a normalized list from a csv string."""
     return [l.strip() for l in csv_string.split(",")]
@@ -78,10 +78,13 @@ def get_current_season():
 
 
 def get_team_abbrevs(season=None):
+    """Returns the set of team abbreviations for the season (for membership tests)."""
     if not season:
         season = get_current_season()
     team_dict = get_team_dict(season)
-    team_abbrevs = [team_dict[team_id]["abbreviation"] for team_id in team_dict]
+    team_abbrevs = frozenset(
+        team_dict[team_id]["abbreviation"] for team_id in team_dict
+    )
     # print(str(team_abbrevs))
     return team_abbrevs
 
@@ -2,10 +2,11 @@
 Models the game data retrieved via JSON.
 """
 
+import concurrent.futures
 import logging
 import pprint
-import time
 
+from datetime import date
 from datetime import datetime
 from datetime import timedelta
 from dateutil import parser
@@ -22,6 +23,9 @@ from mlbv.mlbam.common.displayutil import ANSI
 
 LOG = logging.getLogger(__name__)
 
+# maximum number of game days to retrieve concurrently
+MAX_CONCURRENT_REQUESTS = 8
+
 
 # this map is used to transform the statsweb feed name to something shorter
 FEEDTYPE_MAP = {
@@ -47,9 +51,16 @@ FEEDTYPE_MAP = {
 class GameDataRetriever:
     """Retrieves and parses game data from statsapi.mlb.com"""
 
-    def _get_games_by_date(self, date_str=None):
+    def __init__(self, include_info=True):
+        # include_info: whether to build the preview/summary text for the --info display
+        self.include_info = include_info
+
+    def _get_games_by_date(self, date_str=None, game_pk=None):
+        """Returns the game records for the date, or None if there are no games.
+        If game_pk is given then only that game is requested, bypassing the cache.
+        """
         if date_str is None:
-            date_str = time.strftime("%Y-%m-%d")
+            date_str = date.today().isoformat()
 
         # https://statsapi.mlb.com/api/v1/schedule?sportId=1&startDate=2018-03-26&endDate=2018-03-26&hydrate=schedule.teams,schedule.linescore,schedule.game.content.media.epg
         # hydrate = 'hydrate=schedule.teams,schedule.linescore,schedule.game.content.media.epg'
@@ -63,9 +74,18 @@ class GameDataRetriever:
             config.CONFIG.parser["api_url"], date_str, hydrate
         )
 
-        json_data = request.request_json(
-            url, "gamedata-{}".format(date_str), cache_stale=request.CACHE_SHORT
-        )
+        output_filename = "gamedata-{}".format(date_str)
+
+        # games from before yesterday are over (yesterday's may have run past midnight),
+        # so their data can be cached much longer
+        cache_stale = request.CACHE_SHORT
+        if game_pk is not None:
+            url += "&gamePk={}".format(game_pk)
+            output_filename += "-{}".format(game_pk)
+            cache_stale = request.CACHE_NEVER
+        elif date_str < (date.today() - timedelta(days=1)).isoformat():
+            cache_stale = request.CACHE_DAY
+        json_data = request.request_json(url, output_filename, cache_stale=cache_stale)
 
         game_records = dict()  # we return this dictionary
 
@@ -204,92 +224,12 @@ class GameDataRetriever:
 
             game_rec["favourite"] = gamedata.is_fav(game_rec)
 
-            game_rec["preview"] = list()
-            try:
-                if (
-                    "probablePitcher" in game["teams"]["away"]
-                    or "probablePitcher" in game["teams"]["home"]
-                ):
-                    game_rec["preview"].append("Probable Pitchers")
-                    game_rec["preview"].append("-----------------")
-                    for teamtype in ("away", "home"):
-                        if "probablePitcher" in game["teams"][teamtype]:
-                            # if config.CONFIG.parser['info_display_articles'] and 'fullName' in game['teams'][teamtype]['probablePitcher']:
-                            if "fullName" in game["teams"][teamtype]["probablePitcher"]:
-                                pitcher_name = " ".join(
-                                    reversed(
-                                        game["teams"][teamtype]["probablePitcher"][
-                                            "fullName"
-                                        ].split(",")
-                                    )
-                                ).strip()
-                                if (
-                                    config.CONFIG.parser.getboolean(
-                                        "info_display_articles"
-                                    )
-                                    and "note"
-                                    in game["teams"][teamtype]["probablePitcher"]
-                                ):
-                                    note = game["teams"][teamtype]["probablePitcher"][
-                                        "note"
-                                    ]
-                                    game_rec["preview"].append(
-                                        "{}: {}: {}".format(
-                                            game["teams"][teamtype]["team"]["teamName"],
-                                            pitcher_name,
-                                            note,
-                                        )
-                                    )
-                                else:
-                                    game_rec["preview"].append(
-                                        "{}: {}".format(
-                                            game["teams"][teamtype]["team"]["teamName"],
-                                            pitcher_name,
-                                        )
-                                    )
-                                if (
-                                    config.CONFIG.parser.getboolean(
-                                        "info_display_articles"
-                                    )
-                                    and teamtype == "away"
-                                ):
-                                    game_rec["preview"].append("")
-
-            except:
-                game_rec["preview"] = None
-
-            game_rec["summary"] = list()
-            try:
-                if "headline" in game["content"]["editorial"]["recap"]["mlb"]:
-                    game_rec["summary"].append(
-                        "SUMMARY: "
-                        + game["content"]["editorial"]["recap"]["mlb"]["headline"]
-                    )
-                if "subhead" in game["content"]["editorial"]["recap"]["mlb"]:
-                    game_rec["summary"].append(
-                        "         "
-                        + game["content"]["editorial"]["recap"]["mlb"]["subhead"]
-                    )
-                if config.CONFIG.parser.getboolean("info_display_articles", True):
-                    if len(game_rec["summary"]) > 0:
-                        game_rec["summary"].append("")
-                    if "seoTitle" in game["content"]["editorial"]["recap"]["mlb"]:
-                        # game_rec['summary'].append('TITLE: ' + game['content']['editorial']['recap']['mlb']['seoTitle'])
-                        game_rec["summary"].append(
-                            game["content"]["editorial"]["recap"]["mlb"]["seoTitle"]
-                        )
-                        game_rec["summary"].append(
-                            "-"
-                            * len(
-                                game["content"]["editorial"]["recap"]["mlb"]["seoTitle"]
-                            )
-                        )
-                    if "body" in game["content"]["editorial"]["recap"]["mlb"]:
-                        game_rec["summary"].append(
-                            game["content"]["editorial"]["recap"]["mlb"]["body"]
-                        )
-            except:
-                game_rec["summary"] = None
+            # the preview/summary text is only used for the --info game display
+            game_rec["preview"] = None
+            game_rec["summary"] = None
+            if self.include_info:
+                game_rec["preview"] = self._get_preview(game)
+                game_rec["summary"] = self._get_summary(game)
 
             game_rec["feed"] = dict()
             if game_rec["abstractGameState"] == "Preview":
@@ -393,21 +333,123 @@ class GameDataRetriever:
 
         return game_records
 
+    @staticmethod
+    def _get_preview(game):
+        """Returns the preview text (probable pitchers) shown with --info."""
+        preview = list()
+        try:
+            if (
+                "probablePitcher" in game["teams"]["away"]
+                or "probablePitcher" in game["teams"]["home"]
+            ):
+                preview.append("Probable Pitchers")
+                preview.append("-----------------")
+                for teamtype in ("away", "home"):
+                    if "probablePitcher" in game["teams"][teamtype]:
+                        # if config.CONFIG.parser['info_display_articles'] and 'fullName' in game['teams'][teamtype]['probablePitcher']:
+                        if "fullName" in game["teams"][teamtype]["probablePitcher"]:
+                            pitcher_name = " ".join(
+                                reversed(
+                                    game["teams"][teamtype]["probablePitcher"][
+                                        "fullName"
+                                    ].split(",")
+                                )
+                            ).strip()
+                            if (
+                                config.CONFIG.parser.getboolean("info_display_articles")
+                                and "note" in game["teams"][teamtype]["probablePitcher"]
+                            ):
+                                note = game["teams"][teamtype]["probablePitcher"][
+                                    "note"
+                                ]
+                                preview.append(
+                                    "{}: {}: {}".format(
+                                        game["teams"][teamtype]["team"]["teamName"],
+                                        pitcher_name,
+                                        note,
+                                    )
+                                )
+                            else:
+                                preview.append(
+                                    "{}: {}".format(
+                                        game["teams"][teamtype]["team"]["teamName"],
+                                        pitcher_name,
+                                    )
+                                )
+                            if (
+                                config.CONFIG.parser.getboolean("info_display_articles")
+                                and teamtype == "away"
+                            ):
+                                preview.append("")
+
+        except:
+            return None
+        return preview
+
+    @staticmethod
+    def _get_summary(game):
+        """Returns the game summary text (recap) shown with --info."""
+        summary = list()
+        try:
+            if "headline" in game["content"]["editorial"]["recap"]["mlb"]:
+                summary.append(
+                    "SUMMARY: "
+                    + game["content"]["editorial"]["recap"]["mlb"]["headline"]
+                )
+            if "subhead" in game["content"]["editorial"]["recap"]["mlb"]:
+                summary.append(
+                    "         "
+                    + game["content"]["editorial"]["recap"]["mlb"]["subhead"]
+                )
+            if config.CONFIG.parser.getboolean("info_display_articles", True):
+                if len(summary) > 0:
+                    summary.append("")
+                if "seoTitle" in game["content"]["editorial"]["recap"]["mlb"]:
+                    # game_rec['summary'].append('TITLE: ' + game['content']['editorial']['recap']['mlb']['seoTitle'])
+                    summary.append(
+                        game["content"]["editorial"]["recap"]["mlb"]["seoTitle"]
+                    )
+                    summary.append(
+                        "-"
+                        * len(game["content"]["editorial"]["recap"]["mlb"]["seoTitle"])
+                    )
+                if "body" in game["content"]["editorial"]["recap"]["mlb"]:
+                    summary.append(game["content"]["editorial"]["recap"]["mlb"]["body"])
+        except:
+            return None
+        return summary
+
     def get_audio_stream_url(self):
         # http://hlsaudio-akc.med2.med.nhl.com/ls04/nhl/2017/12/31/NHL_GAME_AUDIO_TORVGK_M2_VISIT_20171231_1513799214035/master_radio.m3u8
         pass
 
     def process_game_data(self, game_date, num_days=1):
+        start_date = date.fromisoformat(game_date)
+        game_dates = [
+            (start_date + timedelta(days=day)).isoformat() for day in range(0, num_days)
+        ]
+        if len(game_dates) > 1:
+            # the requests are independent, so retrieve multiple days concurrently
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(len(game_dates), MAX_CONCURRENT_REQUESTS)
+            ) as executor:
+                game_records_list = list(
+                    executor.map(self._get_games_by_date, game_dates)
+                )
+        else:
+            game_records_list = [self._get_games_by_date(d) for d in game_dates]
         game_days_list = list()
-        for _ in range(0, num_days):
-            game_records = self._get_games_by_date(game_date)
+        for game_date, game_records in zip(game_dates, game_records_list):
             if game_records is not None:
                 game_days_list.append((game_date, game_records))
-            game_date = datetime.strftime(
-                datetime.strptime(game_date, "%Y-%m-%d") + timedelta(days=1), "%Y-%m-%d"
-            )
         return game_days_list
 
+    def refresh_game_data(self, game_date, game_pk):
+        """Retrieves the current data for a single game (e.g. once the game has started).
+        Returns the game records dict containing only the given game, or None if not found.
+        """
+        return self._get_games_by_date(game_date, game_pk)
+
     @staticmethod
     def get_boxscore(game_pk):
         url = "{0}/api/v1/game/{1}/boxscore".format(
@@ -67,18 +67,18 @@ def find_highlight_url_for_team(game_rec, feedtype):
 def get_game_rec(game_data, team_to_play, game_number_str):
     """game_number_str: is an string 1 or 2 indicating game number for doubleheader"""
     game_rec = None
-    for game_pk in game_data:
+    for candidate_rec in game_data.values():
         if team_to_play in (
-            game_data[game_pk]["away"]["abbrev"],
-            game_data[game_pk]["home"]["abbrev"],
+            candidate_rec["away"]["abbrev"],
+            candidate_rec["home"]["abbrev"],
         ):
             if (
-                game_data[game_pk]["doubleHeader"] != "N"
-                and game_number_str != game_data[game_pk]["gameNumber"]
+                candidate_rec["doubleHeader"] != "N"
+                and game_number_str != candidate_rec["gameNumber"]
             ):
                 # game is doubleheader but not our game_number
                 continue
-            game_rec = game_data[game_pk]
+            game_rec = candidate_rec
             break
     if game_rec is None:
         if int(game_number_str) > 1:
@@ -97,6 +97,7 @@ def play_stream(
     inning_ident,
     is_multi_highlight=False,
 ):
+    """inning_ident: is an optional (inning_half, inning_num) tuple to start the stream from"""
     if game_rec["doubleHeader"] != "N":
         LOG.info("Selected game number %s of doubleheader", game_rec["gameNumber"])
     if feedtype is not None and feedtype in config.HIGHLIGHT_FEEDTYPES:
@@ -222,14 +223,9 @@ def _lookup_inning_timestamp_via_airings(
     return broadcast_start, None, None
 
 
-def _calculate_inning_offset(inning_offset, media_state, media_playback_id, game_rec):
-    inning_half = "top"
-    if inning_offset.startswith("b"):
-        inning_half = "bottom"
-    if len(inning_offset) > 1 and inning_offset[-2].isnumeric():
-        inning = inning_offset[-2:]  # double digits, extra innings
-    else:
-        inning = inning_offset[-1]  # single digit inning
+def _calculate_inning_offset(inning_ident, media_state, media_playback_id, game_rec):
+    inning_half, inning_num = inning_ident
+    inning = str(inning_num)
     (
         broadcast_start_timestamp,
         inning_start_timestamp,
@@ -238,7 +234,7 @@ def _calculate_inning_offset(inning_offset, media_state, media_playback_id, game
         game_rec, media_playback_id, inning, inning_half
     )
     if inning_start_timestamp is None:
-        LOG.error("Inning '%s' not found in airing data", inning_offset)
+        LOG.error("Inning '%s %s' not found in airing data", inning_half, inning)
         return None
 
     stream_start_offset_secs = config.CONFIG.parser.getint(
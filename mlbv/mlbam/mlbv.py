@@ -12,26 +12,32 @@ import argparse
 import inspect
 import logging
 import os
+import re
+import signal
 import subprocess
 import sys
-import time
+import threading
 
+from datetime import date
 from datetime import datetime
 from datetime import timedelta
 
 import mlbv.mlbam.common.config as config
-import mlbv.mlbam.common.gamedata as gamedata
 import mlbv.mlbam.common.util as util
-import mlbv.mlbam.mlbapidata as mlbapidata
 import mlbv.mlbam.mlbconfig as mlbconfig
-import mlbv.mlbam.mlbgamedata as mlbgamedata
-import mlbv.mlbam.standings as standings
-import mlbv.mlbam.stats as stats
-import mlbv.mlbam.mlbstream as mlbstream
+
+# Note: the remaining mlbam modules (game data, standings, stats, streaming) pull in
+# requests/lxml/etc. They are imported within main() only on the code paths which need them.
 
 
 LOG = None  # initialized in init_logging
 
+# --inning format: {t|b}{inning_num}
+INNING_RE = re.compile(r"^([tb]?)(\d{1,2})$")
+
+# --wait: interval for printing a progress dot while waiting for game start
+WAIT_PROGRESS_SECS = 60
+
 HELP_TEAM_CODES = (
     "ari",
     "atl",
@@ -76,11 +82,183 @@ Filters:
 
 Feed Identifiers:
     You can use either the short form feed identifier or the long form:
-    {feedhelp}""".format(
-    feedhelp=gamedata.get_feedtype_keystring(mlbgamedata.FEEDTYPE_MAP)
+    {feedhelp}"""
+
+
+class LazyHelpArgumentParser(argparse.ArgumentParser):
+    """ArgumentParser which fills in the team/feed/standings help text only when help is
+    displayed, so that the game data and standings modules are not imported (and the help
+    text is not formatted) on every invocation.
+    Help strings reference the values as '{team_codes}' or '{standings_options}'."""
+
+    def format_help(self):
+        import mlbv.mlbam.common.gamedata as gamedata
+        import mlbv.mlbam.mlbgamedata as mlbgamedata
+        import mlbv.mlbam.standings as standings
+
+        self.epilog = HELP_FOOTER.format(
+            feedhelp=gamedata.get_feedtype_keystring(mlbgamedata.FEEDTYPE_MAP)
+        )
+        help_values = {
+            "{team_codes}": str(HELP_TEAM_CODES),
+            "{standings_options}": ", ".join(standings.STANDINGS_OPTIONS),
+        }
+        for action in self._actions:
+            for key, value in help_values.items():
+                if action.help and key in action.help:
+                    action.help = action.help.replace(key, value)
+        return super().format_help()
+
+
+class FastPathArgumentParser(argparse.ArgumentParser):
+    """Minimal parser for the common options. Raises on error instead of exiting,
+    so that the full parser can handle (and report) anything unexpected."""
+
+    def error(self, message):
+        raise argparse.ArgumentError(None, message)
+
+
+# Default values for all arguments. These are shared by the full argument parser and
+# the fast-path parse in parse_args(), so must include every argument destination.
+ARG_DEFAULTS = {
+    "init": False,
+    "usage": False,
+    "date": None,
+    "days": 1,
+    "team": None,
+    "info": None,
+    "feed": None,
+    "resolution": None,
+    "inning": None,
+    "inning_offset": None,
+    "from_start": False,
+    "favs": None,
+    "filter": None,
+    "list_filters": False,
+    "game": "1",
+    "scores": None,
+    "linescore": None,
+    "boxscore": None,
+    "username": None,
+    "password": None,
+    "fetch": False,
+    "url": False,
+    "wait": False,
+    "standings": None,
+    "stats": None,
+    "recaps": None,
+    "verbose": False,
+    "debug": False,
+    "cache": None,
+}
+
+
+def _true_if_set(arg_val):
+    return "true" if arg_val else None
+
+
+def _value_if_set(arg_val):
+    return arg_val if arg_val else None
+
+
+def _str_if_not_none(arg_val):
+    return None if arg_val is None else str(arg_val)
+
+
+def _filter_if_set(arg_val):
+    """For the optional filter given with --linescore/--boxscore."""
+    return arg_val if arg_val and arg_val != "all" else None
+
+
+# Arguments which override config file settings, as (arg name, config key, converter).
+# The converter returns the config value, or None to leave the config setting as-is.
+# These are applied in order, e.g. --filter takes precedence over the --linescore filter.
+CONFIG_OVERRIDES = (
+    ("info", "info_display_articles", lambda v: "false" if v == "short" else None),
+    ("debug", "debug", _true_if_set),
+    ("verbose", "verbose", _true_if_set),
+    ("cache", "cache", _value_if_set),
+    ("username", "username", _value_if_set),
+    ("password", "password", _value_if_set),
+    ("inning_offset", "stream_start_offset_secs", _str_if_not_none),
+    ("resolution", "resolution", _value_if_set),
+    ("scores", "scores", _value_if_set),
+    ("linescore", "filter", _filter_if_set),
+    ("linescore", "linescore", _true_if_set),
+    ("boxscore", "filter", _filter_if_set),
+    ("boxscore", "boxscore", _true_if_set),
+    ("favs", "favs", _value_if_set),
+    ("filter", "filter", _value_if_set),
 )
 
 
+def apply_config_overrides(args, config_parser):
+    """Applies the CONFIG_OVERRIDES given in args to the config settings."""
+    for arg_name, config_key, convert in CONFIG_OVERRIDES:
+        config_val = convert(getattr(args, arg_name))
+        if config_val is not None:
+            config_parser[config_key] = config_val
+
+
+def parse_date_arg(date_arg):
+    """argparse type for date arguments, format: yyyy-mm-dd."""
+    try:
+        return datetime.strptime(date_arg, "%Y-%m-%d").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            "invalid date '{}', expected format: yyyy-mm-dd".format(date_arg)
+        )
+
+
+def parse_inning_arg(inning_arg):
+    """argparse type for the --inning argument, format: {t|b}{inning_num}.
+    Returns a tuple of (inning_half, inning_num), where inning_half is 'top' or 'bottom'.
+    """
+    match = INNING_RE.match(inning_arg)
+    if not match:
+        raise argparse.ArgumentTypeError(
+            "invalid inning '{}', expected format: {{t|b}}{{inning_num}}".format(
+                inning_arg
+            )
+        )
+    inning_half = "bottom" if match.group(1) == "b" else "top"
+    return inning_half, int(match.group(2))
+
+
+def resolve_date_args(args):
+    """Fills in the default date (today), and applies a negative --days value
+    by going back that many days from the selected date."""
+    if args.date is None:
+        args.date = date.today()
+    if args.days < 0:
+        # To support Issue #49
+        args.days = abs(args.days)
+        args.date -= timedelta(days=args.days)
+
+
+def wait_for_game_start(game_start_utc):
+    """Blocks until game_start_utc, printing a progress dot every WAIT_PROGRESS_SECS.
+    Returns False if the wait is cancelled via Ctrl-c.
+    """
+    # SIGINT sets the event, which ends the wait immediately
+    stop_event = threading.Event()
+    prev_sigint_handler = signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    try:
+        while not util.has_reached_time(game_start_utc):
+            # the remaining time is re-checked against the wall clock each interval
+            # (in case the system has been suspended)
+            wait_secs = min(
+                WAIT_PROGRESS_SECS, util.get_secs_until_time(game_start_utc)
+            )
+            if stop_event.wait(max(wait_secs, 0)):
+                return False
+            sys.stdout.write(".")
+            sys.stdout.flush()
+    finally:
+        signal.signal(signal.SIGINT, prev_sigint_handler)
+    return True
+
+
 def display_usage():
     """Displays contents of readme file."""
     current_dir = os.path.dirname(inspect.getfile(inspect.currentframe()))
@@ -98,13 +276,11 @@ def display_usage():
     return 0
 
 
-def main():
-    """Entry point for mlbv"""
-
+def build_arg_parser():
+    """Builds the full argument parser."""
     # using argparse (2.7+) https://docs.python.org/2/library/argparse.html
-    parser = argparse.ArgumentParser(
+    parser = LazyHelpArgumentParser(
         description=HELP_HEADER,
-        epilog=HELP_FOOTER,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     parser.add_argument(
@@ -113,21 +289,40 @@ def main():
         help="Generates a config file using a combination of defaults plus prompting for MLB.tv credentials.",
     )
     parser.add_argument("--usage", action="store_true", help="Display full usage help.")
-    parser.add_argument(
-        "-d", "--date", help="Display games/standings for date. Format: yyyy-mm-dd"
+    date_group = parser.add_mutually_exclusive_group()
+    date_group.add_argument(
+        "-d",
+        "--date",
+        type=parse_date_arg,
+        help="Display games/standings for date. Format: yyyy-mm-dd",
     )
     parser.add_argument(
         "--days",
         type=int,
-        default=1,
-        help="Number of days to display. Use negative number to go back from today.",
+        help=(
+            "Number of days to display. "
+            "Use negative number to go back from the selected date (default: today)."
+        ),
+    )
+    date_group.add_argument(
+        "--tomorrow",
+        dest="date",
+        action="store_const",
+        const=date.today() + timedelta(days=1),
+        help="Use tomorrow's date",
+    )
+    date_group.add_argument(
+        "--yesterday",
+        dest="date",
+        action="store_const",
+        const=date.today() - timedelta(days=1),
+        help="Use yesterday's date",
     )
-    parser.add_argument("--tomorrow", action="store_true", help="Use tomorrow's date")
-    parser.add_argument("--yesterday", action="store_true", help="Use yesterday's date")
     parser.add_argument(
         "-t",
         "--team",
-        help="Play selected game feed for team, one of: {}".format(HELP_TEAM_CODES),
+        type=str.lower,
+        help="Play selected game feed for team, one of: {team_codes}",
     )
     parser.add_argument(
         "--info",
@@ -163,6 +358,7 @@ def main():
     parser.add_argument(
         "-i",
         "--inning",
+        type=parse_inning_arg,
         help=(
             "Start live/archive stream from inning. Format: {t|b}{inning_num}. "
             "t|b: (optional) top or bottom, inning_num: inning number. "
@@ -201,20 +397,22 @@ def main():
     parser.add_argument(
         "-g",
         "--game",
-        default="1",
         choices=("1", "2"),
         help="Select game number of double-header",
     )
     parser.add_argument(
         "-s",
         "--scores",
-        action="store_true",
+        action="store_const",
+        const="true",
         help="Show scores (default off; overrides config file)",
     )
     parser.add_argument(
         "-n",
         "--no-scores",
-        action="store_true",
+        dest="scores",
+        action="store_const",
+        const="false",
         help="Do not show scores (default on; overrides config file)",
     )
     parser.add_argument(
@@ -262,9 +460,7 @@ def main():
         metavar="category",
         help=(
             "Display the selected standings category, then exit. "
-            "'[category]' is one of: '"
-            + ", ".join(standings.STANDINGS_OPTIONS)
-            + "' [default: %(default)s]. "
+            "'[category]' is one of: '{standings_options}' [default: %(default)s]. "
             "The standings category can be shortened down to one character (all matching "
             "categories will be included), e.g. 'div'. "
             "Can be combined with -d/--date option to show standings for any given date."
@@ -303,7 +499,34 @@ def main():
     parser.add_argument(
         "--cache", help=argparse.SUPPRESS
     )  # normal, never, forever, ...
-    args = parser.parse_args()
+    parser.set_defaults(**ARG_DEFAULTS)
+    return parser
+
+
+def parse_args(argv=None):
+    """Parses the command-line arguments.
+    The common case of only selecting a team and/or date is handled by a minimal parser,
+    skipping the construction of the full parser (and its help text).
+    """
+    fast_parser = FastPathArgumentParser(add_help=False, allow_abbrev=False)
+    fast_parser.add_argument("-t", "--team", type=str.lower)
+    fast_parser.add_argument("-d", "--date", type=parse_date_arg)
+    try:
+        known_args, remaining = fast_parser.parse_known_args(argv)
+    except argparse.ArgumentError:
+        # let the full parser report the error
+        remaining = True
+    if not remaining:
+        args = argparse.Namespace(**ARG_DEFAULTS)
+        args.team = known_args.team
+        args.date = known_args.date
+        return args
+    return build_arg_parser().parse_args(argv)
+
+
+def main():
+    """Entry point for mlbv"""
+    args = parse_args()
 
     if args.usage:
         return display_usage()
@@ -317,96 +540,69 @@ def main():
     # get our config
     config.CONFIG = config.Config(mlbconfig.DEFAULTS, args)
 
-    # append log files if DEBUG is set (from top of file)
-    util.init_logging(
-        os.path.join(
-            util.get_tempdir(),
-            os.path.splitext(os.path.basename(sys.argv[0]))[0] + ".log",
-        ),
-        True,
-    )
+    # append to log file only if debug/verbose is set (via args or config file)
+    log_file = None
+    if config.DEBUG or config.VERBOSE:
+        log_file = os.path.join(util.get_tempdir(), config.SCRIPT_NAME + ".log")
+    util.init_logging(log_file, True)
 
     global LOG
     LOG = logging.getLogger(__name__)
 
-    if args.info and args.info == "short":
-        config.CONFIG.parser["info_display_articles"] = "false"
-
     if args.list_filters:
+        import mlbv.mlbam.mlbapidata as mlbapidata
+
         print("List of built filters: " + ", ".join(sorted(mlbapidata.FILTERS.keys())))
         return 0
-    if args.debug:
-        config.CONFIG.parser["debug"] = "true"
-    if args.verbose:
-        config.CONFIG.parser["verbose"] = "true"
-    if args.cache:
-        config.CONFIG.parser["cache"] = args.cache
-    if args.username:
-        config.CONFIG.parser["username"] = args.username
-    if args.password:
-        config.CONFIG.parser["password"] = args.password
-    if args.inning_offset is not None:
-        config.CONFIG.parser["stream_start_offset_secs"] = str(args.inning_offset)
-    if args.team:
-        team_to_play = args.team.lower()
-        if team_to_play not in mlbapidata.get_team_abbrevs():
-            # Issue #4 all-star game has funky team codes
-            LOG.warning("Unexpected team code: %s", team_to_play)
-    if args.feed:
-        feedtype = gamedata.convert_to_long_feedtype(
-            args.feed.lower(), mlbgamedata.FEEDTYPE_MAP
-        )
-    if args.resolution:
-        config.CONFIG.parser["resolution"] = args.resolution
-    if args.scores:
-        config.CONFIG.parser["scores"] = "true"
-    elif args.no_scores:
-        config.CONFIG.parser["scores"] = "false"
-    if args.linescore:
-        if args.linescore != "all":
-            config.CONFIG.parser["filter"] = args.linescore
-        config.CONFIG.parser["linescore"] = "true"
-    if args.boxscore:
-        if args.boxscore != "all":
-            config.CONFIG.parser["filter"] = args.boxscore
-        config.CONFIG.parser["boxscore"] = "true"
-    if args.favs:
-        config.CONFIG.parser["favs"] = args.favs
-    if args.filter:
-        config.CONFIG.parser["filter"] = args.filter
+    apply_config_overrides(args, config.CONFIG.parser)
 
     if config.DEBUG:
         LOG.info(str(config.CONFIG))
     else:
         LOG.debug(str(config.CONFIG))
 
-    if args.yesterday:
-        args.date = datetime.strftime(datetime.today() - timedelta(days=1), "%Y-%m-%d")
-    elif args.tomorrow:
-        args.date = datetime.strftime(datetime.today() + timedelta(days=1), "%Y-%m-%d")
-    elif args.days < 0:
-        # To support Issue #49
-        args.days = abs(args.days)
-        args.date = datetime.strftime(
-            datetime.today() - timedelta(days=args.days), "%Y-%m-%d"
-        )
-    elif args.date is None:
-        args.date = datetime.strftime(datetime.today(), "%Y-%m-%d")
+    resolve_date_args(args)
+    date_str = args.date.isoformat()  # yyyy-mm-dd
 
     if args.standings:
-        standings.get_standings(args.standings, args.date, args.filter)
+        import mlbv.mlbam.standings as standings
+
+        standings.get_standings(args.standings, date_str, args.filter)
         return 0
     if args.stats:
+        import mlbv.mlbam.stats as stats
+
         # def get_team_stats(team_code, team_code_id_map, stats_option='all', date_str=None):
-        stats.get_stats(args.stats, args.date, args.filter)
+        stats.get_stats(args.stats, date_str, args.filter)
         return 0
 
-    gamedata_retriever = mlbgamedata.GameDataRetriever()
+    # the standings/stats have exited by now, so everything below is for the game data
+    import mlbv.mlbam.common.gamedata as gamedata
+    import mlbv.mlbam.mlbgamedata as mlbgamedata
+
+    if args.team:
+        import mlbv.mlbam.mlbapidata as mlbapidata
+
+        team_to_play = args.team
+        if team_to_play not in mlbapidata.get_team_abbrevs():
+            # Issue #4 all-star game has funky team codes
+            LOG.warning("Unexpected team code: %s", team_to_play)
+        # the feed only applies to streaming the selected team's game
+        if args.feed:
+            feedtype = gamedata.convert_to_long_feedtype(
+                args.feed.lower(), mlbgamedata.FEEDTYPE_MAP
+            )
+
+    # the game list is only displayed if there is nothing to play
+    display_games = not team_to_play and not args.recaps
+    gamedata_retriever = mlbgamedata.GameDataRetriever(
+        include_info=display_games and args.info is not None
+    )
 
     # retrieve all games for the dates given
-    game_day_tuple_list = gamedata_retriever.process_game_data(args.date, args.days)
+    game_day_tuple_list = gamedata_retriever.process_game_data(date_str, args.days)
 
-    if not team_to_play and not args.recaps:
+    if display_games:
         # nothing to play; display the games
         presenter = mlbgamedata.GameDatePresenter()
         displayed_count = 0
@@ -417,6 +613,8 @@ def main():
                 print("")
         return 0
 
+    import mlbv.mlbam.mlbstream as mlbstream
+
     # from this point we only care about first day in list
     if len(game_day_tuple_list) > 0:
         game_date, game_data = game_day_tuple_list[0]
@@ -485,20 +683,18 @@ def main():
             "Waiting for game to start. Local start time is %s",
             util.convert_time_to_local(game_rec["mlbdate"]),
         )
-        print("Use Ctrl-c to quit .", end="", flush=True)
-        count = 0
-        while not util.has_reached_time(game_rec["mlbdate"]):
-            time.sleep(10)
-            count += 1
-            if count % 6 == 0:
-                print(".", end="", flush=True)
-
-        # refresh the game data
+        sys.stdout.write("Use Ctrl-c to quit .")
+        sys.stdout.flush()
+        if not wait_for_game_start(game_rec["mlbdate"]):
+            print("")
+            LOG.info("Cancelled wait for game start")
+            return 0
+        print("")
+
+        # refresh the game data (only for our game, the stream info is now available)
         LOG.info("Game time. Refreshing game data after wait...")
-        game_day_tuple_list = gamedata_retriever.process_game_data(args.date, 1)
-        if len(game_day_tuple_list) > 0:
-            game_date, game_data = game_day_tuple_list[0]
-        else:
+        game_data = gamedata_retriever.refresh_game_data(date_str, game_rec["game_pk"])
+        if not game_data:
             LOG.error("Unexpected error: no game data found after refresh on wait")
             return 0
 
@@ -508,12 +704,12 @@ def main():
         game_rec,
         team_to_play,
         feedtype,
-        args.date,
+        date_str,
         args.fetch,
         args.from_start,
         args.inning,
     )
 
 
-if __name__ in ("__main__", "main"):
+if __name__ == "__main__":
     sys.exit(main())
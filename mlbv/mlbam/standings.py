@@ -7,6 +7,7 @@ Help: see https://github.com/dword4/nhlapi#standing
 import logging
 import time
 
+from datetime import date
 from datetime import datetime
 
 import mlbv.mlbam.mlbapidata as mlbapidata
@@ -60,7 +61,7 @@ def _add_to_header(header, text):
 def get_standings(standings_option="all", date_str=None, args_filter=None):
     """Displays standings."""
     LOG.debug("Getting standings for %s, option=%s", date_str, standings_option)
-    if date_str == time.strftime("%Y-%m-%d"):
+    if date_str == date.today().isoformat():
         # strip out date string from url (issue #5)
         date_str = None
     if util.substring_match(standings_option, "all") or util.substring_match(
@@ -4,7 +4,7 @@
 
 import logging
 
-from datetime import datetime
+from datetime import date
 
 import mlbv.mlbam.mlbapidata as mlbapidata
 import mlbv.mlbam.common.displayutil as displayutil
@@ -304,7 +304,7 @@ def get_stats(target_input, date_str=None, args_filter=None):
         return False
 
     if not date_str:
-        date_str = datetime.strftime(datetime.today(), "%Y-%m-%d")
+        date_str = date.today().isoformat()
 
     season = date_str.split("-")[0]
 
@@ -0,0 +1,60 @@
+"""pytest test cases for the mlbv argument parsing
+"""
+
+from datetime import date
+from datetime import timedelta
+
+import pytest
+
+from mlbv.mlbam import mlbv
+
+
+def test_arg_defaults_match_parser():
+    assert vars(mlbv.build_arg_parser().parse_args([])) == mlbv.ARG_DEFAULTS
+
+
+def test_fast_path_args():
+    argv = ["-t", "tor", "--date", "2021-04-24"]
+    assert mlbv.parse_args(argv) == mlbv.build_arg_parser().parse_args(argv)
+    argv = ["-t", "tor", "--wait"]
+    assert mlbv.parse_args(argv).wait
+    assert mlbv.parse_args(["-t", "TOR"]).team == "tor"
+    assert mlbv.parse_args(["-t", "TOR", "--wait"]).team == "tor"
+
+
+def test_date_args():
+    assert mlbv.parse_args(["-d", "2021-04-24"]).date == date(2021, 4, 24)
+    assert mlbv.parse_args(["--yesterday"]).date == date.today() - timedelta(days=1)
+    with pytest.raises(SystemExit):
+        mlbv.parse_args(["-d", "04/24/2021"])
+    with pytest.raises(SystemExit):
+        mlbv.parse_args(["-d", "2021-04-24", "--tomorrow"])
+
+
+def test_inning_arg():
+    assert mlbv.parse_inning_arg("5") == ("top", 5)
+    assert mlbv.parse_inning_arg("t5") == ("top", 5)
+    assert mlbv.parse_inning_arg("b10") == ("bottom", 10)
+    with pytest.raises(SystemExit):
+        mlbv.parse_args(["-i", "x5"])
+
+
+def test_config_overrides():
+    settings = {"filter": "", "scores": "true"}
+    args = mlbv.parse_args(["-n", "--linescore", "tor", "--inning-offset", "0"])
+    mlbv.apply_config_overrides(args, settings)
+    assert settings == {
+        "filter": "tor",
+        "scores": "false",
+        "linescore": "true",
+        "stream_start_offset_secs": "0",
+    }
+    mlbv.apply_config_overrides(mlbv.parse_args(["-l", "--filter", "nyy"]), settings)
+    assert settings["filter"] == "nyy"
+
+
+def test_negative_days():
+    args = mlbv.parse_args(["-d", "2021-04-24", "--days", "-3"])
+    mlbv.resolve_date_args(args)
+    assert args.date == date(2021, 4, 21)
+    assert args.days == 3